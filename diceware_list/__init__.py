@@ -21,11 +21,12 @@ import itertools
 import logging
 import math
 import string
+import sys
 from diceware_list.libwordlist import (
     DICE_SIDES,
     base_terms_iterator,
     filter_chars,
-    idx_to_dicenums,
+    iter_dicenums,
     logger,
     min_width_iter,
     paths_iterator,
@@ -200,18 +201,24 @@ def generate_wordlist(
             allowed = chars
         input_terms = filter_chars(input_terms, allowed=allowed)
     separator = "-"
-    base_terms = base_terms_iterator(use_kit=use_kit, use_416=use_416)
-    terms = itertools.chain(input_terms, base_terms)
+    terms = itertools.chain(
+        input_terms, base_terms_iterator(use_kit=use_kit, use_416=use_416)
+    )
     if lowercase:
-        terms = [x.lower() for x in terms]
-    terms = sorted(set(terms))
+        terms = {x.lower() for x in terms}
+    else:
+        terms = set(terms)
     if not use_kit and not use_416:
         min_word_len = min_word_len or min_word_length(terms, length)
         terms = list(min_length_iter(terms, min_word_len))
     if prefix_code in ("short", "long"):
+        # only prefix stripping needs all terms sorted. `min_width_iter` picks
+        # terms in a well-defined order by itself.
         prefer_short = prefix_code == "short"
         terms = list(
-            strip_matching_prefixes(terms, is_sorted=True, prefer_short=prefer_short)
+            strip_matching_prefixes(
+                sorted(terms), is_sorted=True, prefer_short=prefer_short
+            )
         )
     if length is None:
         length = len(terms)
@@ -221,17 +228,17 @@ def generate_wordlist(
             "Wordlist (after filtering) too short: "
             "at least %s terms required." % length
         )
-    if length and numbered:
-        dicenum = int(math.ceil(math.log(length) / math.log(dice_sides)))
+    terms = sorted(min_width_iter(terms, length, shuffle_max))
+    if not (numbered and length):
+        for term in terms:
+            yield term
+        return
+    dicenum = max(1, int(math.ceil(math.log(length) / math.log(dice_sides))))
     if dice_sides < 10:
         separator = ""
-    all_dice = ""
-    for num, term in enumerate(sorted(min_width_iter(terms, length, shuffle_max))):
-        if numbered:
-            all_dice = (
-                idx_to_dicenums(num, dicenum, dice_sides, separator=separator) + " "
-            )
-        yield "%s%s" % (all_dice, term)
+    dicenums = iter_dicenums(dicenum, dice_sides, separator=separator)
+    for dice, term in zip(dicenums, terms):
+        yield "%s %s" % (dice, term)
 
 
 def main():
@@ -248,7 +255,7 @@ def main():
         logger.addHandler(logging.StreamHandler())
         logger.debug("Verbose logging enabled")
         logger.info("Creating wordlist...")
-    for term in generate_wordlist(
+    wordlist = generate_wordlist(
         all_terms,
         args.length,
         use_kit=args.use_kit,
@@ -260,8 +267,8 @@ def main():
         lowercase=not args.uppercase,
         chars=args.chars,
         min_word_len=args.min_wordlen,
-    ):
-        print(term)
+    )
+    sys.stdout.writelines(term + "\n" for term in wordlist)
 
 
 if __name__ == "__main__":  # pragma: no cover
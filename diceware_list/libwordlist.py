@@ -17,19 +17,11 @@
 
 """libwordlist -- a library for wordlist-related operations.
 """
-from __future__ import unicode_literals
-
-try:
-    from urllib.request import urlopen  # python 3.x
-except ImportError:  # pragma: no cover
-    from urllib2 import urlopen  # python 2.x
-try:
-    from urllib.parse import urlparse  # python 3.x
-except ImportError:  # pragma: no cover
-    from urlparse import urlparse  # python 2.x
 import base64
-import codecs
+import bisect
+import collections
 import decimal
+import functools
 import itertools
 import logging
 import math
@@ -39,6 +31,7 @@ import re
 import sys
 import unicodedata
 import zlib
+from urllib.parse import urlparse
 
 
 DICE_SIDES = 6  #: we normally handle 6-sided dice.
@@ -55,27 +48,43 @@ logger = logging.getLogger("libwordlist")
 logger.addHandler(logging.NullHandler())
 
 
+#: Dicenum digit strings, indexed by die value minus one.
+_DIGIT_STR = tuple(str(x) for x in range(1, 21))
+
+
+#: Chars replaced by `normalize()` before stripping diacritics.
+_TRANSFORMS = {
+    "ä": "ae",
+    "Ä": "AE",
+    "æ": "ae",
+    "Æ": "AE",
+    "ö": "oe",
+    "Ö": "OE",
+    "ø": "oe",
+    "Ø": "OE",
+    "ü": "ue",
+    "Ü": "UE",
+    "ß": "ss",
+    "Ð": "D",
+    "Đ": "D",
+    "đ": "d",
+}
+
+#: `_TRANSFORMS` as translation table for `str.translate()`.
+_TRANSFORMS_TABLE = str.maketrans(_TRANSFORMS)
+
+
 def normalize(text):
     """Normalize text."""
-    TRANSFORMS = {
-        "ä": "ae",
-        "Ä": "AE",
-        "æ": "ae",
-        "Æ": "AE",
-        "ö": "oe",
-        "Ö": "OE",
-        "ø": "oe",
-        "Ø": "OE",
-        "ü": "ue",
-        "Ü": "UE",
-        "ß": "ss",
-        "Ð": "D",
-        "Đ": "D",
-        "đ": "d",
-    }
-    transformed = "".join([TRANSFORMS.get(x, x) for x in text])
+    if text.isascii():
+        # nothing to translate or decompose
+        return text
+    transformed = text.translate(_TRANSFORMS_TABLE)
+    if transformed.isascii():
+        # transforms never introduce combining chars
+        return transformed
     nfkd_form = unicodedata.normalize("NFKD", transformed)
-    return "".join([c for c in nfkd_form if not unicodedata.combining(c)])
+    return "".join(itertools.filterfalse(unicodedata.combining, nfkd_form))
 
 
 def base10_to_n(num, base):
@@ -179,14 +188,52 @@ def idx_to_dicenums(item_index, dice_num, dice_sides=DICE_SIDES, separator="-"):
         '212'
 
     """
-    nums = [x + 1 for x in base10_to_n(item_index, dice_sides)]
-    padded = [
-        1,
-    ] * dice_num + nums
-    return separator.join(["%s" % x for x in padded[-dice_num:]])
+    digit_str = _DIGIT_STR
+    if dice_sides > len(digit_str):
+        digit_str = [str(x) for x in range(1, dice_sides + 1)]
+    # fill in the digits from right to left. Unset leading digits stay "1".
+    digits = ["1"] * dice_num
+    pos = dice_num
+    while item_index and pos:
+        pos -= 1
+        item_index, digit = divmod(item_index, dice_sides)
+        digits[pos] = digit_str[digit]
+    return separator.join(digits)
+
+
+def iter_dicenums(dice_num, dice_sides=DICE_SIDES, separator="-"):
+    """Yield the dicenums of all list item indexes in order.
+
+    The n-th value yielded equals ``idx_to_dicenums(n, dice_num,
+    dice_sides, separator)``, but no arithmetic is done per item::
+
+        >>> list(iter_dicenums(2, 2))
+        ['1-1', '1-2', '2-1', '2-2']
+
+    Altogether ``dice_sides ** dice_num`` dicenums are yielded.
+    """
+    digits = [str(x) for x in range(1, dice_sides + 1)]
+    for combination in itertools.product(digits, repeat=dice_num):
+        yield separator.join(combination)
+
+
+class _LengthView(object):
+    """A read-only view on the lengths of items in `seq`.
+
+    Lets `bisect` search a list sorted by item length.
+    """
 
+    def __init__(self, seq):
+        self.seq = seq
 
-def shuffle_max_width_items(word_list, max_width=None):
+    def __len__(self):
+        return len(self.seq)
+
+    def __getitem__(self, index):
+        return len(self.seq[index])
+
+
+def shuffle_max_width_items(word_list, max_width=None, is_sorted=False):
     """Shuffle entries of `word_list` that have max width.
 
     Yields items in `word_list` in preserved order, but with maximum
@@ -205,7 +252,26 @@ def shuffle_max_width_items(word_list, max_width=None):
 
     That means the three maximum-width elements at the end are returned
     in different order.
+
+    If `is_sorted` is ``True``, we expect `word_list` to be a list of
+    stripped terms, already sorted by length. The maximum width entries
+    are then looked up by bisection instead of scanning all terms.
+    Results are undefined for lists that are given as sorted, but are in
+    fact not.
     """
+    if is_sorted:
+        if max_width is None:
+            max_width = len(word_list[-1]) if word_list else 0
+        lengths = _LengthView(word_list)
+        start = bisect.bisect_left(lengths, max_width)
+        end = bisect.bisect_right(lengths, max_width, lo=start)
+        for entry in word_list[:start]:
+            yield entry
+        max_width_entries = word_list[start:end]
+        random.shuffle(max_width_entries)
+        for entry in max_width_entries:
+            yield entry
+        return
     word_list = [x.strip() for x in word_list]
     if max_width is None:
         max_width = len(max(word_list, key=len))
@@ -217,36 +283,58 @@ def shuffle_max_width_items(word_list, max_width=None):
         yield entry
 
 
-def term_iterator(file_descriptors):
+def term_iterator(file_descriptors, splitlines=False):
     """Yield terms from files in `file_descriptors`.
 
     Empty lines are ignored.
 
-    `file_descriptors` must be open for reading.
+    `file_descriptors` must be open for reading. Each file is read at once
+    and split at ``\n`` chars. If `splitlines` is ``True``, it is split at
+    all line boundaries known to `str.splitlines()` instead, including form
+    feeds and unicode line separators.
     """
     for fd in file_descriptors:
-        for term in fd:
-            term = term.strip()
-            if term:
-                yield term
+        content = fd.read()
+        if splitlines:
+            lines = content.splitlines()
+        else:
+            newline = b"\n" if isinstance(content, bytes) else "\n"
+            lines = content.split(newline)
+        terms = [x.strip() for x in lines]
+        for term in filter(None, terms):
+            yield term
 
 
 def paths_iterator(paths):
     """Yield terms from files in `paths`.
 
     Each path is expected to be a readable, utf-8 encoded file containing
-    terms, one per line.
+    terms, one per line. Lines of files end at any line boundary known to
+    `str.splitlines()`, so terms never contain form feeds or unicode line
+    separators.
     """
     for path in paths:
         if path == "-":
             for term in term_iterator([sys.stdin]):
                 yield term
         else:
-            with codecs.open(path, "r", encoding="utf-8") as fd:
-                for term in term_iterator([fd]):
+            with open(path, "r", encoding="utf-8") as fd:
+                for term in term_iterator([fd], splitlines=True):
                     yield term
 
 
+@functools.lru_cache(maxsize=None)
+def _read_base_terms(name):
+    """Get the terms of base list `name` as tuple.
+
+    The (small) lists are shipped with this package and do not change, so we
+    read each of them only once.
+    """
+    path = os.path.join(os.path.dirname(__file__), name)
+    with open(path, "r", encoding="utf-8") as fd:
+        return tuple(term_iterator([fd]))
+
+
 def base_terms_iterator(use_kit=True, use_416=True):
     """Iterator over all base terms.
 
@@ -256,8 +344,8 @@ def base_terms_iterator(use_kit=True, use_416=True):
     With `use_kit` and `use_416` you can tell whether these files should
     be used for generating lists or not.
 
-    Terms are delivered encoded. This way we make sure, they have the
-    same binary format as other terms read from files by `argparse`.
+    Terms are delivered as text, stripped and with empty lines removed, like
+    terms read by `paths_iterator()`.
     """
     names = []
     if use_kit:
@@ -268,10 +356,9 @@ def base_terms_iterator(use_kit=True, use_416=True):
     if use_416:
         logger.debug("Adding source list: diceware416.txt")
         names += ["diceware416.txt"]
-    dir_path = os.path.join(os.path.dirname(__file__))
-    fd_list = [open(os.path.join(dir_path, name), "r") for name in names]
-    for term in term_iterator(fd_list):
-        yield term
+    for name in names:
+        for term in _read_base_terms(name):
+            yield term
 
 
 def min_width_iter(iterator, num, shuffle_max_width=True, min_len=0):
@@ -296,13 +383,24 @@ def min_width_iter(iterator, num, shuffle_max_width=True, min_len=0):
     Please note that the iterator returned, delivers elements sorted by
     length first and terms of same length sorted alphabetically.
 
+    Terms are stripped before their length is determined, so we also
+    accept lines read from files.
     """
-    all_terms = sorted(
-        filter(lambda x: len(x) >= min_len, iterator), key=lambda x: (len(x), x)
-    )
-    if shuffle_max_width:
-        max_width = len(all_terms[num - 1])
-        all_terms = shuffle_max_width_items(all_terms, max_width)
+    # bucket terms by length, so we only have to sort terms of same length
+    buckets = collections.defaultdict(list)
+    for term in iterator:
+        term = term.strip()
+        width = len(term)
+        if width >= min_len:
+            buckets[width].append(term)
+    all_terms = []
+    for width in sorted(buckets):
+        if len(all_terms) >= num:
+            break
+        # the last bucket contains all max width entries, not only the first
+        all_terms.extend(sorted(buckets[width]))
+    if shuffle_max_width and all_terms:
+        all_terms = shuffle_max_width_items(all_terms, is_sorted=True)
     for term in itertools.islice(all_terms, num):  # yield first num terms...
         yield term
 
@@ -315,8 +413,14 @@ def min_length_iter(iterator, min_len=0):
 
     The `min_len` parameter tells the minimal length we expect for each term.
     """
-    for term in filter(lambda x: len(x) >= min_len, iterator):
-        yield term
+    if min_len <= 0:
+        # every term is long enough, no need to check each of them.
+        for term in iterator:
+            yield term
+        return
+    for term in iterator:
+        if len(term) >= min_len:
+            yield term
 
 
 def is_prefix_code(iterable, is_sorted=False):
@@ -676,6 +780,8 @@ class AndroidWordList(object):
         if self.path is None:
             url = self.full_url % self.lang
         logger.info("Fetching wordlist from %s" % url)
+        from urllib.request import urlopen  # expensive, import on demand
+
         data = urlopen(url).read()
         if self.path is None:
             # the android `gitiles` repo provides files only base64 encoded.
@@ -768,6 +874,8 @@ class AndroidWordList(object):
 
         Fetches list of valid language codes from Android site.
         """
+        from urllib.request import urlopen  # expensive, import on demand
+
         resp = urlopen(self.base_url)
         html = resp.read()
         codes = [
@@ -16,7 +16,6 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """ wldownload -- CLI to download and mangle remote wordlists.
 """
-from __future__ import unicode_literals, print_function
 import argparse
 import logging
 import os
@@ -24,11 +23,6 @@ import sys
 from diceware_list import __version__
 from diceware_list.libwordlist import AndroidWordList, logger
 
-try:
-    BrokenPipeError is not None  # Python 3.x
-except NameError:  # pragma: no cover
-    BrokenPipeError = IOError  # Python 2.x
-
 
 def get_cmdline_args(args=None):
     """Handle commandline options for `wldownload`."""
@@ -16,7 +16,6 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """wlflakes -- CLI to find flakes in diceware wordlists.
 """
-from __future__ import unicode_literals
 import argparse
 from diceware_list import __version__
 from diceware_list.libwordlist import (
@@ -17,13 +17,30 @@
 #
 """py.test config for `diceware-list` modules.
 """
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
 import base64
 import decimal
+import functools
 import logging
 import os
 import pytest
 import shutil
 import sys
+from diceware_list import __version__
+
+
+def pytest_configure(config):
+    """Register our custom markers."""
+    config.addinivalue_line("markers", "no_network: test never touches the network.")
+    config.addinivalue_line(
+        "markers",
+        "shared_download: test uses the mocked Android downloads. Mark those "
+        'tests also with `xdist_group("download")`.',
+    )
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run tests of group `name` on one worker."
+    )
 
 
 @pytest.fixture
@@ -101,8 +118,51 @@ def local_android_dir(request, tmpdir):
     return tmpdir
 
 
+@pytest.fixture(scope="session")
+def _android_download_template(tmp_path_factory):
+    """py.test fixture providing base64-encoded sample wordlists.
+
+    The sample wordlists are encoded and written only once per test session.
+    Use `local_android_download_b64` to get a private copy of them.
+    """
+    template = tmp_path_factory.mktemp("android_tpl")
+    for lang in ["de", "en"]:
+        src_path = os.path.join(
+            os.path.dirname(__file__), "sample_short_wordlist_%s.gz" % lang
+        )
+        with open(src_path, "rb") as fd:
+            data = base64.b64encode(fd.read())
+        (template / ("%s_wordlist.combined.gz" % lang)).write_bytes(data)
+    shutil.copy2(
+        os.path.join(os.path.dirname(__file__), "sample_index.html"),
+        str(template / "index.html"),
+    )
+    return template
+
+
+@pytest.fixture(scope="session")
+def set_android_source():
+    """py.test fixture providing a function to set the Android download source.
+
+    The returned function expects a monkeypatcher and a local dir path. It
+    monkeypatches `AndroidWordList` to lookup wordlists in this dir.
+    """
+
+    def setter(mp, path):
+        fake_base_url = "file://%s/" % str(path)
+        mp.setattr("diceware_list.libwordlist.AndroidWordList.base_url", fake_base_url)
+        mp.setattr(
+            "diceware_list.libwordlist.AndroidWordList.full_url",
+            "%s%%s_wordlist.combined.gz" % fake_base_url,
+        )
+
+    return setter
+
+
 @pytest.fixture
-def local_android_download_b64(request, monkeypatch, tmpdir):
+def local_android_download_b64(
+    request, monkeypatch, tmpdir, _android_download_template, set_android_source
+):
     """py.test fixture providing an AndroidWordList with local wordlists.
 
     Copies all local sample wordlists into a new tmpdir. Then monkeypatches
@@ -112,24 +172,9 @@ def local_android_download_b64(request, monkeypatch, tmpdir):
     The files are stored base64-encoded, as this is, what the original google
     repos deliver.
     """
-    for lang in ["de", "en"]:
-        dictfile = tmpdir / ("%s_wordlist.combined.gz" % lang)
-        src_path = os.path.join(
-            os.path.dirname(__file__), "sample_short_wordlist_%s.gz" % lang
-        )
-        dictfile.write(base64.b64encode(open(src_path, "rb").read()))
-    fake_base_url = "file://%s/" % str(tmpdir)
-    index_html = open(
-        os.path.join(os.path.dirname(__file__), "sample_index.html")
-    ).read()
-    tmpdir.join("index.html").write(index_html)
-    monkeypatch.setattr(
-        "diceware_list.libwordlist.AndroidWordList.base_url", fake_base_url
-    )
-    monkeypatch.setattr(
-        "diceware_list.libwordlist.AndroidWordList.full_url",
-        "%s%%s_wordlist.combined.gz" % fake_base_url,
-    )
+    for path in _android_download_template.iterdir():
+        shutil.copy2(str(path), str(tmpdir / path.name))
+    set_android_source(monkeypatch, tmpdir)
     return tmpdir
 
 
@@ -190,6 +235,70 @@ def argv_handler(request):
     request.addfinalizer(teardown)
 
 
+@pytest.fixture(scope="session")
+def run_script():
+    """py.test fixture providing a cached runner for commandline scripts.
+
+    The returned function expects a function that parses ``sys.argv`` (the
+    `main` function or argument parser of a script) and a tuple of commandline
+    args. It returns a tuple ``(out, err, exit_code)``. `exit_code` is ``None``
+    if the script did not exit.
+
+    Results are cached, so each combination of script and args is run only
+    once per test session. Use it only for runs without side effects, like
+    ``--help`` or ``--version``.
+    """
+
+    @functools.lru_cache(maxsize=None)
+    def runner(func, args):
+        out, err, exit_code = StringIO(), StringIO(), None
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(sys, "argv", ["scriptname"] + list(args))
+            with redirect_stdout(out), redirect_stderr(err):
+                try:
+                    func()
+                except SystemExit as exc:
+                    exit_code = exc.code
+        return out.getvalue(), err.getvalue(), exit_code
+
+    return runner
+
+
+@pytest.fixture(scope="session")
+def check_help(run_script):
+    """py.test fixture providing a checker for ``--help`` of scripts.
+
+    The returned function expects the `main` function of a script, calls it
+    with ``--help`` and checks that a help message is shown. The help message
+    is returned for further checks.
+    """
+
+    def checker(main_func):
+        out, err, exit_code = run_script(main_func, ("--help",))
+        assert exit_code == 0
+        assert "show this help message" in out
+        return out
+
+    return checker
+
+
+@pytest.fixture(scope="session")
+def check_version(run_script):
+    """py.test fixture providing a checker for ``--version`` of scripts.
+
+    The returned function expects the `main` function or commandline parser
+    of a script and checks that ``--version`` outputs the current package
+    version.
+    """
+
+    def checker(func):
+        out, err, exit_code = run_script(func, ("--version",))
+        assert exit_code == 0
+        assert __version__ in (out + err)
+
+    return checker
+
+
 @pytest.fixture(scope="function", autouse=True)
 def preserve_decimal_prec(request):
     """Preserve decimal precision."""
@@ -43,21 +43,11 @@ class TestArgParser(object):
             get_cmdline_args(None)
         assert why.value.args[0] == 2
         out, err = capfd.readouterr()
-        if sys.version_info < (3, 0):
-            assert "too few arguments" in err
-        else:
-            assert "the following arguments are required" in err
+        assert "the following arguments are required" in err
 
-    def test_version(self, monkeypatch, capfd):
+    def test_version(self, check_version):
         # we can output current version.
-        with pytest.raises(SystemExit):
-            get_cmdline_args(
-                [
-                    "--version",
-                ]
-            )
-        out, err = capfd.readouterr()
-        assert __version__ in (out + err)
+        check_version(get_cmdline_args)
 
     def test_prefix_options_req_certain_keywords(self, monkeypatch, capfd):
         # we require one of 'short', 'long', 'short' as ``--prefix``.
@@ -261,6 +251,14 @@ class TestGenerateWordlist(object):
         assert len(numbered_list[0].split()) == 2
         assert len(default_list[0].split()) == 1
 
+    def test_arg_numbered_single_term(self):
+        # a list with only one term is numbered with a single die
+        assert list(generate_wordlist(["foo"], length=1, numbered=True)) == ["1 foo"]
+
+    def test_arg_numbered_empty_list(self):
+        # an empty wordlist can be numbered as well
+        assert list(generate_wordlist([], length=0, numbered=True)) == []
+
     def test_arg_ascii_only_is_respected(self, monkeypatch):
         # we respect ascii_only.
         monkeypatch.setattr(random, "shuffle", lambda x: x)
@@ -491,21 +489,13 @@ class TestMain(object):
         with pytest.raises(SystemExit):
             main()
 
-    def test_main_help(self, monkeypatch, capfd):
+    def test_main_help(self, check_help):
         # we can get --help
-        monkeypatch.setattr(sys, "argv", ["scriptname", "--help"])
-        with pytest.raises(SystemExit):
-            main()
-        out, err = capfd.readouterr()
-        assert "positional arguments" in out
+        assert "positional arguments" in check_help(main)
 
-    def test_main_version(self, monkeypatch, capfd):
+    def test_main_version(self, check_version):
         # we can get --version
-        monkeypatch.setattr(sys, "argv", ["scriptname", "--version"])
-        with pytest.raises(SystemExit):
-            main()
-        out, err = capfd.readouterr()
-        assert __version__ in out + err
+        check_version(main)
 
     def test_main_output(self, monkeypatch, capfd, dictfile):
         # we can output simple lists
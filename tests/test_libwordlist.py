@@ -16,13 +16,8 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 # Tests for libwordlist module
-from __future__ import unicode_literals
-
-try:
-    from urllib.request import urlopen, URLError  # python 3.x
-except ImportError:  # pragma: no cover
-    from urllib2 import urlopen, URLError  # python 2.x
 from io import StringIO
+from urllib.request import urlopen, URLError
 import codecs
 import decimal
 import gzip
@@ -36,6 +31,7 @@ from diceware_list.libwordlist import (
     filter_chars,
     base_terms_iterator,
     idx_to_dicenums,
+    iter_dicenums,
     min_width_iter,
     normalize,
     shuffle_max_width_items,
@@ -124,6 +120,19 @@ def test_idx_to_dicenums():
     assert idx_to_dicenums(0, 3) == "1-1-1"  # default
     assert idx_to_dicenums(0, 3, separator="sep") == "1sep1sep1"
     assert idx_to_dicenums(0, 3, separator="") == "111"
+    # dice with many sides
+    assert idx_to_dicenums(19, 1, 20) == "20"
+    assert idx_to_dicenums(20, 2, 21) == "1-21"
+
+
+def test_iter_dicenums():
+    # we can get all dicenums in order
+    assert list(iter_dicenums(1)) == ["1", "2", "3", "4", "5", "6"]
+    assert list(iter_dicenums(2, 2, separator="")) == ["11", "12", "21", "22"]
+    # results match those of `idx_to_dicenums`
+    for sides in (2, 6, 12):
+        expected = [idx_to_dicenums(x, 3, sides) for x in range(sides**3)]
+        assert list(iter_dicenums(3, sides)) == expected
 
 
 def test_idx_to_dicenums_gives_text():
@@ -147,6 +156,7 @@ def test_min_length_iter():
     assert list(min_length_iter(iter([]))) == []
     assert list(min_length_iter(iter([]), 1)) == []
     assert list(min_length_iter(iter(["a", "bb", "ccc"]), 2)) == ["bb", "ccc"]
+    assert list(min_length_iter(iter(["a", "bb"]))) == ["a", "bb"]
 
 
 def test_min_width_iter_shuffle_max_widths_values(monkeypatch):
@@ -214,6 +224,10 @@ def test_normalize():
     assert normalize("ŴŵŶŷŸŹźŻżŽžſ") == "WwYyYZzZzZzs"
     # "þĦħĦħıĸŁłŊŋŉŒœŦŧƀƁƂƃƄƅƆƇƈƉƊƋƌƍ""
     assert normalize("mäßig") == "maessig"
+    # pure ASCII is left alone
+    assert normalize("Foo-bar 1") == "Foo-bar 1"
+    # text that is ASCII after transforms
+    assert normalize("Ärger") == "AErger"
 
 
 def test_normalize_gives_text():
@@ -244,6 +258,22 @@ def test_shuffle_max_width_items(monkeypatch):
     assert result == ["cc", "bb", "aa"]
 
 
+def test_shuffle_max_width_items_sorted(monkeypatch):
+    # we can shuffle max width items of lists sorted by length
+    monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
+    result = list(shuffle_max_width_items(["a", "aa", "bb", "cc"], is_sorted=True))
+    assert result == ["a", "cc", "bb", "aa"]
+    # longer items are left out
+    result = list(
+        shuffle_max_width_items(
+            ["aa", "bb", "ccc", "ddd", "eeee"], max_width=3, is_sorted=True
+        )
+    )
+    assert result == ["aa", "bb", "ddd", "ccc"]
+    # an empty list
+    assert list(shuffle_max_width_items([], is_sorted=True)) == []
+
+
 def test_shuffle_max_width_items_copes_with_files(monkeypatch, tmpdir):
     # when shuffling max width entries we accept file input
     monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
@@ -254,6 +284,19 @@ def test_shuffle_max_width_items_copes_with_files(monkeypatch, tmpdir):
     assert result == [b"a", b"cc", b"bb"]
 
 
+def test_min_width_iter_copes_with_files(monkeypatch, tmpdir):
+    # when picking min width entries we accept file input
+    monkeypatch.setattr(random, "shuffle", lambda x: x.reverse())
+    wlist = tmpdir.join("wlist.txt")
+    wlist.write("\n".join(["a", "bb", "cc", " dd"]))
+    with open(str(wlist), "r") as fd:
+        result = list(min_width_iter(fd, 2))
+    assert result == ["a", "dd"]
+    # whitespace is stripped also without shuffling
+    result = list(min_width_iter(["a\n", " bb"], 2, shuffle_max_width=False))
+    assert result == ["a", "bb"]
+
+
 def test_base_terms_iterator():
     # we can get an iterator over base terms
     base_iter = base_terms_iterator()
@@ -313,6 +356,18 @@ class TestTermIterator(object):
             )
         assert result == ["ä", "ö"]
 
+    def test_term_iterator_splits_at_newlines_only(self, tmpdir):
+        # chars like form feeds inside a line do not split terms
+        wlist = tmpdir.join("wlist.txt")
+        wlist.write_text("foo\x0cbar\r\nbaz\u2028qux\n", "utf-8")
+        with open(str(wlist), "r", encoding="utf-8") as fd:
+            result = list(term_iterator([fd]))
+        assert result == ["foo\x0cbar", "baz\u2028qux"]
+        # optionally we split at all line boundaries
+        with open(str(wlist), "r", encoding="utf-8") as fd:
+            result = list(term_iterator([fd], splitlines=True))
+        assert result == ["foo", "bar", "baz", "qux"]
+
     def test_term_iterator_ignores_empty_lines(self, tmpdir):
         # empty lines will be ignored
         wlist = tmpdir.join("wlist.txt")
@@ -352,6 +407,13 @@ class TestPathsIterator(object):
         result = list(paths_iterator([str(wlist1), str(wlist2)]))
         assert result == ["a", "b", "c", "d"]
 
+    def test_paths_iterator_splits_at_all_line_boundaries(self, tmpdir):
+        # form feeds and unicode line separators end terms
+        wlist = tmpdir.join("wlist.txt")
+        wlist.write_text("foo\x0cbar\nbaz\u2028qux\n", "utf-8")
+        result = list(paths_iterator([str(wlist)]))
+        assert result == ["foo", "bar", "baz", "qux"]
+
     def test_read_stdin(self, tmpdir, argv_handler):
         # we can tell to read from stdin (dash as filename)
         sys.stdin = StringIO("term1\nterm2\näöü\n")
@@ -16,10 +16,11 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 # Tests for wldownload module
-from __future__ import unicode_literals
+from contextlib import redirect_stderr, redirect_stdout
+from io import StringIO
+import os
 import pytest
 import sys
-from diceware_list import __version__
 from diceware_list.libwordlist import AndroidWordList
 from diceware_list.wldownload import (
     download_wordlist,
@@ -29,6 +30,30 @@ from diceware_list.wldownload import (
 )
 
 
+@pytest.fixture(scope="session")
+def default_main_result(
+    tmp_path_factory, _android_download_template, set_android_source
+):
+    """Result of running `main()` without any options.
+
+    `main()` is run only once per test session, with the (base64 encoded)
+    sample wordlists as download source and an empty user home as working
+    dir.
+
+    Returns a tuple ``(out, err, home_contents)``.
+    """
+    home = tmp_path_factory.mktemp("home")
+    out, err = StringIO(), StringIO()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sys, "argv", ["scriptname"])
+        mp.setenv("HOME", str(home))
+        mp.chdir(str(home))
+        set_android_source(mp, _android_download_template)
+        with redirect_stdout(out), redirect_stderr(err):
+            main()
+    return out.getvalue(), err.getvalue(), os.listdir(str(home))
+
+
 def test_get_save_path(home_dir):
     # we can clearly determine a path to store data
     wl = AndroidWordList()
@@ -37,6 +62,9 @@ def test_get_save_path(home_dir):
     assert get_save_path(wl, outfile="foo") == str(home_dir / "foo")
 
 
+@pytest.mark.no_network
+@pytest.mark.shared_download
+@pytest.mark.xdist_group("download")
 class TestDowmloadWordlist(object):
 
     def test_download_wordlist(self, home_dir, local_android_download_b64, capfd):
@@ -53,29 +81,16 @@ class TestDowmloadWordlist(object):
         out, err = capfd.readouterr()
         assert out == "der\nund\n"
 
+    @pytest.mark.parametrize(
+        "flag, expect_hardcore", [(True, False), (False, True), (None, True)]
+    )
     def test_download_wordlist_respects_filter_offensive(
-        self, home_dir, local_android_download_b64, capfd
+        self, flag, expect_hardcore, home_dir, local_android_download_b64, capfdbinary
     ):
         # we respect the given `filter_offensive` flag
-        download_wordlist(filter_offensive=True)
-        out, err = capfd.readouterr()
-        assert "hardcore" not in out
-
-    def test_download_wordlist_respects_filter_offensive_false(
-        self, home_dir, local_android_download_b64, capfd
-    ):
-        # we respect the given `filter_offensive` flag if ``False``
-        download_wordlist(filter_offensive=False)
-        out, err = capfd.readouterr()
-        assert "hardcore" in out
-
-    def test_download_wordlist_respects_filter_offensive_none(
-        self, home_dir, local_android_download_b64, capfd
-    ):
-        # we respect the given `filter_offensive` flag if ``None``
-        download_wordlist(filter_offensive=None)
-        out, err = capfd.readouterr()
-        assert "hardcore" in out
+        download_wordlist(filter_offensive=flag)
+        out, err = capfdbinary.readouterr()
+        assert (b"hardcore" in out) is expect_hardcore
 
     def test_download_wordlist_copes_with_broken_pipe(
         self, home_dir, local_android_download_b64, capfd, monkeypatch
@@ -83,10 +98,7 @@ class TestDowmloadWordlist(object):
         # broken pipe exceptions are caught
         def mock_write(text, *args, **kw):
             if "hardcore" in text:
-                try:
-                    raise BrokenPipeError()  # python 3.x
-                except NameError:
-                    raise IOError()  # python 2.7
+                raise BrokenPipeError()
             return sys.stdout._write(text, *args, **kw)
 
         sys.stdout._write = sys.stdout.write
@@ -99,60 +111,28 @@ class TestDowmloadWordlist(object):
 
 class TestArgParser(object):
 
-    def test_version(self, capfd):
+    def test_version(self, check_version):
         # we can output current version.
-        with pytest.raises(SystemExit):
-            get_cmdline_args(
-                [
-                    "--version",
-                ]
-            )
-        out, err = capfd.readouterr()
-        assert __version__ in (out + err)
+        check_version(get_cmdline_args)
 
-    def test_verbose(self):
+    @pytest.mark.parametrize(
+        "argv, expected", [([], None), (["-v"], 1), (["--verbose"], 1), (["-vv"], 2)]
+    )
+    def test_verbose(self, argv, expected):
         # we can require verbosity
-        args = get_cmdline_args([])
-        assert args.verbose is None
-        args = get_cmdline_args(
-            [
-                "-v",
-            ]
-        )
-        assert args.verbose == 1
-        args = get_cmdline_args(
-            [
-                "--verbose",
-            ]
-        )
-        assert args.verbose == 1
-        args = get_cmdline_args(
-            [
-                "-vv",
-            ]
-        )
-        assert args.verbose == 2
+        assert get_cmdline_args(argv).verbose == expected
 
-    def test_outfile(self, capfd):
+    @pytest.mark.parametrize(
+        "argv, expected",
+        [([], None), (["-o", "foo"], "foo"), (["--outfile", "bar"], "bar")],
+    )
+    def test_outfile(self, argv, expected):
         # we can set an output path
-        args = get_cmdline_args([])
-        assert args.outfile is None
-        args = get_cmdline_args(
-            [
-                "-o",
-                "foo",
-            ]
-        )
-        assert args.outfile == "foo"
-        args = get_cmdline_args(
-            [
-                "--outfile",
-                "bar",
-            ]
-        )
-        assert args.outfile == "bar"
+        assert get_cmdline_args(argv).outfile == expected
+
+    def test_outfile_requires_path(self, capfd):
+        # the path should not be empty
         with pytest.raises(SystemExit):
-            # the path should not be empty
             get_cmdline_args(
                 [
                     "-o",
@@ -172,14 +152,12 @@ class TestArgParser(object):
         )
         assert args.raw is True
 
-    def test_lang(self):
+    @pytest.mark.parametrize(
+        "argv, expected", [([], "en"), (["--lang", "de"], "de"), (["-l", "fr"], "fr")]
+    )
+    def test_lang(self, argv, expected):
         # we can request a certain language
-        args = get_cmdline_args([])
-        assert args.lang == "en"
-        args = get_cmdline_args(["--lang", "de"])
-        assert args.lang == "de"
-        args = get_cmdline_args(["-l", "fr"])
-        assert args.lang == "fr"
+        assert get_cmdline_args(argv).lang == expected
 
     def test_lang_codes(self):
         # we can ask for a list of valid lang codes
@@ -189,68 +167,49 @@ class TestArgParser(object):
         assert args.lang_codes is True
 
 
+@pytest.mark.no_network
+@pytest.mark.shared_download
+@pytest.mark.xdist_group("download")
 class TestMain(object):
 
-    def test_main(self, monkeypatch, local_android_download_b64, capfd):
+    def test_main(self, default_main_result):
         # we can call the main function
-        monkeypatch.setattr(
-            sys,
-            "argv",
-            [
-                "scriiptname",
-            ],
-        )
-        main()
-        out, err = capfd.readouterr()
+        out, err, home_contents = default_main_result
         assert out.startswith("the\nto\nof\n")
         assert "hardcore" in out
 
-    def test_can_get_help(self, monkeypatch, capfd, home_dir):
+    def test_can_get_help(self, check_help):
         # we can get help
-        monkeypatch.setattr(sys, "argv", ["scriptname", "--help"])
-        with pytest.raises(SystemExit):
-            main()
-        out, err = capfd.readouterr()
-        assert "show this help message" in out
+        check_help(main)
 
-    def test_main_no_verbose(
-        self, monkeypatch, local_android_download_b64, home_dir, capfd
-    ):
+    def test_main_no_verbose(self, default_main_result):
         # by default we do not save any files.
-        monkeypatch.setattr(
-            sys,
-            "argv",
-            [
-                "scriptname",
-            ],
-        )
-        main()
-        out, err = capfd.readouterr()
+        out, err, home_contents = default_main_result
         assert out != ""
         assert err == ""
-        assert home_dir.listdir() == []
+        assert home_contents == []
 
     def test_main_verbose(
-        self, monkeypatch, local_android_download_b64, home_dir, capfd
+        self, monkeypatch, local_android_download_b64, home_dir, capfdbinary
     ):
         # in verbose mode, we tell at least what we do
         monkeypatch.setattr(sys, "argv", ["scriptname", "-v"])
         main()
-        out, err = capfd.readouterr()
-        assert out.startswith("the\nto\nof\n")
-        assert err != ""
-        assert "Path" not in err
+        out, err = capfdbinary.readouterr()
+        assert out.startswith(b"the\nto\nof\n")
+        assert err != b""
+        assert b"Path" not in err
 
     def test_main_verbose_increased(
-        self, monkeypatch, local_android_download_b64, home_dir, capfd
+        self, monkeypatch, local_android_download_b64, home_dir, capfdbinary
     ):
         # we can be more verbose
         # (also use --raw, because only this way we have debug output)
         monkeypatch.setattr(sys, "argv", ["scriptname", "-vv", "--raw"])
         main()
-        out, err = capfd.readouterr()
-        assert out == ""
-        assert "Path" in err
+        out, err = capfdbinary.readouterr()
+        assert out == b""
+        assert b"Path" in err
 
     def test_main_existing_file_errors(
         self, monkeypatch, local_android_download_b64, home_dir, capfd
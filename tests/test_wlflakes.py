@@ -16,10 +16,9 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """Tests for wlflakes module.
 """
-from __future__ import unicode_literals
+from io import StringIO
 import pytest
 import sys
-from diceware_list import __version__
 from diceware_list.wlflakes import (
     find_flakes,
     get_cmdline_args,
@@ -31,6 +30,32 @@ from diceware_list.wlflakes import (
 )
 
 
+#: Messages expected from checkers.
+E1_FOO_FOOBAR = '2: E1 "foo" from line 1 is a prefix of "foobar"'
+E1_BAR_BARBAZ = '3: E1 "bar" from line 2 is a prefix of "barbaz"'
+E1_BAR_BARBAZ_REVERSED = '2: E1 "bar" from line 3 is a prefix of "barbaz"'
+E1_UMLAUTS = '2: E1 "bär" from line 3 is a prefix of "bärbaz"'
+E2_FOO = '1: E2 "foo" appears multiple times'
+E2_UMLAUTS = '1: E2 "für" appears multiple times'
+E3_A = '1: E3 "a" is too short. Minimum length should be 2.'
+W1_UMLAUTS = '1: W1 "für" contains non-ASCII chars'
+
+
+def wordlist_fd(contents, name="mywordlist.txt"):
+    """Get an in-memory file-like object named `name` containing `contents`."""
+    fd = StringIO(contents)
+    fd.name = name
+    return fd
+
+
+@pytest.fixture(scope="session")
+def flawless_wordlist(tmp_path_factory):
+    """A wordlist file without any flakes."""
+    path = tmp_path_factory.mktemp("wl") / "mywordlist.txt"
+    path.write_text("bar\nbaz\nfoo\n")
+    return path
+
+
 class TestArgParser(object):
 
     def test_sys_argv_as_fallback(self, monkeypatch, capfd, dictfile):
@@ -46,10 +71,7 @@ class TestArgParser(object):
             get_cmdline_args(None)
         assert why.value.args[0] == 2
         out, err = capfd.readouterr()
-        if sys.version_info < (3, 0):
-            assert "too few arguments" in err
-        else:
-            assert "the following arguments are required" in err
+        assert "the following arguments are required" in err
 
     def test_wordlist_file_must_exist(self, capfd):
         # we require at least one argument, a wordlist file
@@ -63,132 +85,106 @@ class TestArgParser(object):
         assert "No such file or directory: " in err
         assert "'foobar'" in err
 
-    def test_version(self, capfd):
+    def test_version(self, check_version):
         # we can output current version.
-        with pytest.raises(SystemExit):
-            get_cmdline_args(
-                [
-                    "--version",
-                ]
-            )
-        out, err = capfd.readouterr()
-        assert __version__ in (out + err)
+        check_version(get_cmdline_args)
 
 
 class TestFindFlakes(object):
 
-    def test_noflakes(self, capfd, tmpdir):
+    def test_noflakes(self, capfd):
         # a flawless wordlist will produce no output
-        wordlist = tmpdir / "mywordlist.txt"
-        wordlist.write("bar\nbaz\nfoo\n")
         find_flakes(
             [
-                open(str(wordlist)),
+                wordlist_fd("bar\nbaz\nfoo\n"),
             ]
         )
         out, err = capfd.readouterr()
         assert out == ""
         assert err == ""
 
-    def test_can_find_prefixes(self, capfd, dictfile, tmpdir):
+    def test_can_find_prefixes(self, capfd):
         # we can find prefixes
-        wordlist = tmpdir / "mywordlist.txt"
-        wordlist.write("bar\nbarfoo\nbaz\n")
-        with open(str(wordlist)) as fd:
-            find_flakes(
-                [
-                    fd,
-                ],
-                prefixes=True,
-            )
+        find_flakes(
+            [
+                wordlist_fd("bar\nbarfoo\nbaz\n"),
+            ],
+            prefixes=True,
+        )
         out, err = capfd.readouterr()
         assert (
             'mywordlist.txt:2: E1 "bar" from line 1 is a ' 'prefix of "barfoo"'
         ) in out
 
-    def test_can_find_doubles(self, capfd, dictfile, tmpdir):
+    def test_can_find_doubles(self, capfd):
         # we can identify double terms
-        wordlist = tmpdir / "wordlist.txt"
-        wordlist.write("bar\nfoo\nbar\n")
-        with open(str(wordlist)) as fd:
-            find_flakes(
-                [
-                    fd,
-                ],
-                prefixes=False,
-            )
+        find_flakes(
+            [
+                wordlist_fd("bar\nfoo\nbar\n", name="wordlist.txt"),
+            ],
+            prefixes=False,
+        )
         out, err = capfd.readouterr()
         assert 'wordlist.txt:1: E2 "bar" appears multiple times' in out
 
-    def test_detect_too_short_terms(self, capfd, dictfile, tmpdir):
+    def test_detect_too_short_terms(self, capfd):
         # we can find out if a term is too short
-        wordlist = tmpdir / "wordlist.txt"
-        wordlist.write("a\nbb\naaa\n")
-        with open(str(wordlist)) as fd:
-            find_flakes(
-                [
-                    fd,
-                ],
-                prefixes=False,
-            )
+        find_flakes(
+            [
+                wordlist_fd("a\nbb\naaa\n", name="wordlist.txt"),
+            ],
+            prefixes=False,
+        )
         out, err = capfd.readouterr()
         assert 'wordlist.txt:1: E3 "a" is too short.' in out
 
 
 class TestCheckers(object):
 
-    def test_E1(self):
-        # we can determine whether a list represents a prefix code
-        assert list(check_E1(["foo", "bar"])) == []
-        assert list(check_E1(["foo", "foobar"])) == [
-            '2: E1 "foo" from line 1 is a prefix of "foobar"'
-        ]
-
-    def test_E1_counts_lines_correctly(self):
-        # check_E1 can count lines
-        assert list(check_E1(["foo", "bar", "barbaz"])) == [
-            '3: E1 "bar" from line 2 is a prefix of "barbaz"'
-        ]
-        assert list(check_E1(["foo", "barbaz", "bar"])) == [
-            '2: E1 "bar" from line 3 is a prefix of "barbaz"'
-        ]
-
-    def test_E1_copes_with_umlauts(self):
-        # E1 works with terms containing non-ASCII chars.
-        assert list(check_E1(["foo", "bärbaz", "bär"])) == [
-            '2: E1 "bär" from line 3 is a prefix of "bärbaz"'
-        ]
-
-    def test_E2(self):
-        # we can check whether a list contains double elements
-        assert list(check_E2(["foo", "bar"])) == []
-        assert list(check_E2(["foo", "foo"])) == ['1: E2 "foo" appears multiple times']
-
-    def test_E2_copes_with_umlauts(self):
-        # E2 works with terms containing umlauts
-        assert list(check_E2(["für", "für", "far"])) == [
-            '1: E2 "für" appears multiple times'
-        ]
-
-    def test_E3(self):
-        # we detect too short terms
-        assert list(check_E3(["a", "bb", "aaa"])) == [
-            '1: E3 "a" is too short. Minimum length should be 2.'
-        ]
-
-    def test_W1(self):
-        # we can detect terms containing non-ASCII chars
-        assert list(check_W1([b"foo", b"bar"])) == []
-        assert list(check_W1(["für".encode("utf-8"), "bar".encode("utf-8")])) == [
-            '1: W1 "für" contains non-ASCII chars'
-        ]
-
-    def test_W1_unicode_input(self):
-        # we cope with unicode input
-        assert list(check_W1(["foo", "bar"])) == []
-        assert list(check_W1(["für", "bar"])) == [
-            '1: W1 "für" contains non-ASCII chars'
-        ]
+    @pytest.mark.parametrize(
+        "checker, terms, expected",
+        [
+            pytest.param(check_E1, ["foo", "bar"], [], id="E1_no_prefix"),
+            pytest.param(
+                check_E1, ["foo", "foobar"], [E1_FOO_FOOBAR], id="E1_prefix_foo"
+            ),
+            pytest.param(
+                check_E1,
+                ["foo", "bar", "barbaz"],
+                [E1_BAR_BARBAZ],
+                id="E1_counts_lines",
+            ),
+            pytest.param(
+                check_E1,
+                ["foo", "barbaz", "bar"],
+                [E1_BAR_BARBAZ_REVERSED],
+                id="E1_counts_lines_reversed",
+            ),
+            pytest.param(
+                check_E1, ["foo", "bärbaz", "bär"], [E1_UMLAUTS], id="E1_umlauts"
+            ),
+            pytest.param(check_E2, ["foo", "bar"], [], id="E2_no_doubles"),
+            pytest.param(check_E2, ["foo", "foo"], [E2_FOO], id="E2_doubles"),
+            pytest.param(
+                check_E2, ["für", "für", "far"], [E2_UMLAUTS], id="E2_umlauts"
+            ),
+            pytest.param(check_E3, ["a", "bb", "aaa"], [E3_A], id="E3_too_short"),
+            pytest.param(check_W1, [b"foo", b"bar"], [], id="W1_ascii_bytes"),
+            pytest.param(
+                check_W1,
+                ["für".encode("utf-8"), "bar".encode("utf-8")],
+                [W1_UMLAUTS],
+                id="W1_non_ascii_bytes",
+            ),
+            pytest.param(check_W1, ["foo", "bar"], [], id="W1_ascii_text"),
+            pytest.param(
+                check_W1, ["für", "bar"], [W1_UMLAUTS], id="W1_non_ascii_text"
+            ),
+        ],
+    )
+    def test_checker(self, checker, terms, expected):
+        # checkers yield one message per violation found
+        assert list(checker(terms)) == expected
 
 
 class TestMain(object):
@@ -205,19 +201,13 @@ class TestMain(object):
         with pytest.raises(SystemExit):
             main()
 
-    def test_can_get_help(self, monkeypatch, capfd):
+    def test_can_get_help(self, check_help):
         # we can get help
-        monkeypatch.setattr(sys, "argv", ["scriptname", "--help"])
-        with pytest.raises(SystemExit):
-            main()
-        out, err = capfd.readouterr()
-        assert "show this help message" in out
+        check_help(main)
 
-    def test_can_run_main(self, monkeypatch, capfd, dictfile, tmpdir):
+    def test_can_run_main(self, monkeypatch, capfd, flawless_wordlist):
         # we can run wlflakes.
-        wordlist = tmpdir / "mywordlist.txt"
-        wordlist.write("bar\nfoo\nbaz\n")
-        monkeypatch.setattr(sys, "argv", ["scriptname", str(wordlist)])
+        monkeypatch.setattr(sys, "argv", ["scriptname", str(flawless_wordlist)])
         main()
         out, err = capfd.readouterr()
         assert out == ""